@@ -4,20 +4,112 @@
 from __future__ import annotations
 
 
-from typing import Optional, TypedDict
+import sys
+from functools import lru_cache
+from statistics import fmean
+from typing import Callable, Iterator, Optional, TypedDict
+
+
+# Prompts only need flushing when a person is typing the answers.
+_INTERACTIVE = sys.stdin.isatty()
+
+
+def _prompt(prompt: str) -> str:
+    """Show `prompt` and read one line from standard input.
+
+    Unlike input(), stdout is only flushed for interactive sessions,
+    so scripted runs fed through a pipe keep their output buffered.
+
+    Raises:
+        EOFError: If standard input is exhausted.
+    """
+    sys.stdout.write(prompt)
+    if _INTERACTIVE:
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
 
 class Student(TypedDict):
-    """A student record stored in the `students` list."""
+    """A student record stored in the `StudentStore`."""
 
     name: str
-    grades: list[int]
+    grade_sum: int
+    grade_count: int
+
+
+@lru_cache(maxsize=1024)
+def _normalize(name: str) -> str:
+    """Return the case-folded lookup key for a student name."""
+    return name.strip().casefold()
+
+
+class StudentStore:
+    """Collection of student records indexed by normalized name.
+
+    Keeps insertion order for reports and a dict index for O(1) lookups.
+    """
+
+    def __init__(self) -> None:
+        self._by_norm: dict[str, Student] = {}
+        self._order: list[Student] = []
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[Student]:
+        return iter(self._order)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and _normalize(name) in self._by_norm
+
+    def get(self, name: str) -> Optional[Student]:
+        """Return the student stored under `name`, or None."""
+        return self._by_norm.get(_normalize(name))
+
+    def add(self, name: str) -> Student:
+        """Create, store and return a new student record."""
+        record: Student = {"name": name, "grade_sum": 0, "grade_count": 0}
+        self._by_norm[_normalize(name)] = record
+        self._order.append(record)
+        return record
+
+
+def _average(student: Student) -> Optional[float]:
+    """Return the student's average grade, or None if no grades exist."""
+    if not student["grade_count"]:
+        return None
+    return student["grade_sum"] / student["grade_count"]
+
+
+def _argmax_average(
+    students: StudentStore,
+) -> Optional[tuple[Student, float]]:
+    """Find the student with the highest average in a single pass.
+
+    Each average is computed once; students without grades are skipped.
+
+    Returns:
+        The top student and their average, or None if nobody has grades.
+    """
+    best: Optional[Student] = None
+    best_avg = 0.0
+    for student in students:
+        avg = _average(student)
+        if avg is not None and (best is None or avg > best_avg):
+            best, best_avg = student, avg
+
+    if best is None:
+        return None
+    return best, best_avg
 
 
 def find_student(
-    students: list[Student], name: str
+    students: StudentStore, name: str
 ) -> Optional[Student]:
-    """Search for a student in the list by their name.
+    """Search for a student in the store by their name.
 
     The search is case-insensitive and ignores leading/trailing spaces.
 
@@ -28,32 +120,29 @@ def find_student(
     Returns:
         The student record if found, otherwise None.
     """
-    normalized = name.strip().lower()
-    return next(
-        (s for s in students if s["name"].lower() == normalized), None
-    )
+    return students.get(name)
 
 
-def add_new_student(students: list[Student]) -> None:
+def add_new_student(students: StudentStore) -> None:
     """Create and store a new student in the system.
 
-    Ensures the name is valid and not already registered in the list.
+    Ensures the name is valid and not already registered in the store.
     """
-    name = input("Enter student name: ").strip()
+    name = _prompt("Enter student name: ").strip()
 
     if not name:
         print("Student name cannot be empty.")
         return
 
-    if find_student(students, name) is not None:
+    if name in students:
         print(f"Student '{name}' already exists.")
         return
 
-    students.append({"name": name, "grades": []})
+    students.add(name)
     print(f"Student '{name}' added.")
 
 
-def add_grades_for_student(students: list[Student]) -> None:
+def add_grades_for_student(students: StudentStore) -> None:
     """Record academic performance scores for a specific student.
 
     Accepts multiple grades in the range [0, 100].
@@ -64,17 +153,17 @@ def add_grades_for_student(students: list[Student]) -> None:
         print("No students found. Please add a student first.")
         return
 
-    name = input("Enter student name: ").strip()
+    name = _prompt("Enter student name: ").strip()
     student = find_student(students, name)
 
     if student is None:
         print(f"Student '{name}' not found.")
         return
 
-    initial_count = len(student["grades"])
+    pending: list[int] = []
 
     while True:
-        grade_str = input("Enter a grade (or 'done' to finish): ").strip()
+        grade_str = _prompt("Enter a grade (or 'done' to finish): ").strip()
 
         if grade_str.lower() == "done":
             break
@@ -89,16 +178,20 @@ def add_grades_for_student(students: list[Student]) -> None:
             print("Invalid grade. Please enter a value between 0 and 100.")
             continue
 
-        student["grades"].append(grade)
+        pending.append(grade)
+
+    # Apply the whole batch at once instead of updating the record per grade.
+    grades_added = len(pending)
+    student["grade_sum"] += sum(pending)
+    student["grade_count"] += grades_added
 
-    grades_added = len(student["grades"]) - initial_count
     print(
         f"Grades updated for '{student['name']}'. "
         f"({grades_added} grade(s) added)"
     )
 
 
-def show_report(students: list[Student]) -> None:
+def show_report(students: StudentStore) -> None:
     """Display a comprehensive summary of all students' performance.
 
     Shows individual averages for each student and overall statistics.
@@ -112,13 +205,7 @@ def show_report(students: list[Student]) -> None:
     averages: list[float] = []
 
     for student in students:
-        grades = student["grades"]
-
-        try:
-            student_sum = sum(grades)
-            avg = student_sum / len(grades)
-        except ZeroDivisionError:
-            avg = None
+        avg = _average(student)
 
         if avg is None:
             print(f"{student['name']}'s average grade is N/A.")
@@ -134,7 +221,7 @@ def show_report(students: list[Student]) -> None:
 
     max_avg = max(averages)
     min_avg = min(averages)
-    overall_avg = sum(averages) / len(averages)
+    overall_avg = fmean(averages)
 
     print("------------------------")
     print(f"Max Average: {max_avg:.1f}")
@@ -143,7 +230,7 @@ def show_report(students: list[Student]) -> None:
     print("------------------------\n")
 
 
-def find_top_performer(students: list[Student]) -> None:
+def find_top_performer(students: StudentStore) -> None:
     """Identify the student with the best academic performance.
 
     Compares all students' average grades and displays the top achiever.
@@ -153,18 +240,13 @@ def find_top_performer(students: list[Student]) -> None:
         print("No students found.")
         return
 
-    students_with_grades = [s for s in students if s["grades"]]
+    top = _argmax_average(students)
 
-    if not students_with_grades:
+    if top is None:
         print("No grades available to determine top performer.")
         return
 
-    top_student = max(
-        students_with_grades,
-        key=lambda s: sum(s["grades"]) / len(s["grades"]),
-    )
-    top_avg = sum(top_student["grades"]) / len(top_student["grades"])
-
+    top_student, top_avg = top
     print(
         f"The student with the highest average is {top_student['name']} "
         f"with a grade of {top_avg:.1f}."
@@ -187,35 +269,38 @@ def main() -> None:
     Continuously displays the menu and processes user selections
     until the user chooses to exit.
     """
-    students: list[Student] = []
+    students = StudentStore()
+    actions: dict[int, Callable[[StudentStore], None]] = {
+        1: add_new_student,
+        2: add_grades_for_student,
+        3: show_report,
+        4: find_top_performer,
+    }
 
     try:
         while True:
             print_menu()
-            choice_str = input("Enter your choice: ").strip()
+            choice_str = _prompt("Enter your choice: ").strip()
 
-            try:
-                choice = int(choice_str)
-            except ValueError:
+            # Reject non-numeric input without raising and catching.
+            if not choice_str.isdecimal():
                 print("Invalid choice. Please enter a number from 1 to 5.")
                 continue
 
-            if choice == 1:
-                add_new_student(students)
-            elif choice == 2:
-                add_grades_for_student(students)
-            elif choice == 3:
-                show_report(students)
-            elif choice == 4:
-                find_top_performer(students)
-            elif choice == 5:
+            choice = int(choice_str)
+            if choice == 5:
                 print("Exiting program.")
                 break
-            else:
+
+            action = actions.get(choice)
+            if action is None:
                 print("Invalid choice. Please select a number from 1 to 5.")
+                continue
+
+            action(students)
 
-    except KeyboardInterrupt:
-        # Handle user interruption (Ctrl+C) gracefully.
+    except (KeyboardInterrupt, EOFError):
+        # Handle user interruption (Ctrl+C) or end of input gracefully.
         print("\nExiting program.")
 
 
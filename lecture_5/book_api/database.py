@@ -2,24 +2,34 @@
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from typing import AsyncIterator
 
-DATABASE_URL = "sqlite:///./books.db"
-
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+DATABASE_URL = "sqlite+aiosqlite:///./books.db"
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Reuse open connections instead of reopening the database file on every
+# checkout. The queue pool is set explicitly because some SQLAlchemy versions
+# default aiosqlite to NullPool; its default sizing (5 + 10 overflow) keeps
+# concurrent readers from queueing behind each other.
+engine = create_async_engine(DATABASE_URL, poolclass=AsyncAdaptedQueuePool)
+
+# Keep loaded attributes after commit so RETURNING rows need no reload.
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
 Base = declarative_base()
 
 
-def get_db():
-    """Provide a SQLAlchemy session for a single request."""
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Provide an async SQLAlchemy session for a single request."""
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
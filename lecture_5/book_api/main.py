@@ -1,23 +1,76 @@
 """Simple Book Collection API using FastAPI and SQLAlchemy.
 
+The database layer is async (SQLAlchemy asyncio, which needs `greenlet`,
+on the `aiosqlite` driver). Install the dependencies with:
+    pip install -r requirements.txt
+
 Run the app with:
     uvicorn main:app --reload
+
+The bundled books.db already contains the schema. To start from an empty
+database, set AUTO_CREATE_TABLES=1 so the tables are created on startup:
+    AUTO_CREATE_TABLES=1 uvicorn main:app --reload
 """
 
 from __future__ import annotations
 
-from typing import List, Optional
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Sequence
 
-from fastapi import Depends, FastAPI, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    Body,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import database
 import models
 import schemas
 
-database.Base.metadata.create_all(bind=database.engine)
 
-app = FastAPI(title="Simple Book Collection API")
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Create the database tables (if enabled) before serving requests."""
+    if os.getenv("AUTO_CREATE_TABLES") == "1":
+        async with database.engine.begin() as conn:
+            await conn.run_sync(database.Base.metadata.create_all)
+    yield
+    await database.engine.dispose()
+
+
+app = FastAPI(
+    title="Simple Book Collection API",
+    lifespan=lifespan,
+)
+# Compress larger (list/search) responses for clients that accept gzip.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+
+def _dump_books(books: Sequence[models.Book]) -> bytes:
+    """Encode ORM books straight to JSON bytes with the cached adapter."""
+    adapter = schemas.BookListAdapter
+    return adapter.dump_json(
+        adapter.validate_python(books, from_attributes=True)
+    )
+
+
+def _json_response(
+    content: bytes, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Wrap already-encoded JSON bytes in a response."""
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
 @app.post(
@@ -26,32 +79,72 @@ app = FastAPI(title="Simple Book Collection API")
     status_code=status.HTTP_201_CREATED,
     tags=["books"],
 )
-def create_book(
+async def create_book(
     book: schemas.BookCreate,
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_db),
 ) -> schemas.BookRead:
     """Add a new book to the collection (POST /books/)."""
-    db_book = models.Book(
-        title=book.title,
-        author=book.author,
-        year=book.year,
+    stmt = (
+        insert(models.Book)
+        .values(**book.model_dump())
+        .returning(models.Book)
     )
-    db.add(db_book)
-    db.commit()
-    db.refresh(db_book)
+    db_book = (await db.execute(stmt)).scalar_one()
+    await db.commit()
     return db_book
 
 
+@app.post(
+    "/books/bulk",
+    response_model=List[schemas.BookRead],
+    status_code=status.HTTP_201_CREATED,
+    tags=["books"],
+)
+async def create_books_bulk(
+    books: List[schemas.BookCreate] = Body(
+        ...,
+        max_length=100,
+        description="Books to add (at most 100 per request).",
+    ),
+    db: AsyncSession = Depends(database.get_db),
+) -> Response:
+    """Add several books in one transaction (POST /books/bulk).
+
+    The created books are returned in the same order as the request body.
+    """
+    created: Sequence[models.Book] = []
+    if books:
+        created = (
+            await db.scalars(
+                insert(models.Book).returning(
+                    models.Book, sort_by_parameter_order=True
+                ),
+                [book.model_dump() for book in books],
+            )
+        ).all()
+        await db.commit()
+
+    return _json_response(
+        _dump_books(created), status_code=status.HTTP_201_CREATED
+    )
+
+
 @app.get(
     "/books/",
-    response_model=List[schemas.BookRead],
+    response_model=schemas.BookPage,
     tags=["books"],
 )
-def list_books(
+async def list_books(
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Return books with an ID greater than this cursor.",
+    ),
     skip: int = Query(
         0,
         ge=0,
-        description="Number of records to skip for pagination.",
+        deprecated=True,
+        description="Number of records to skip. Use `after_id` instead.",
     ),
     limit: int = Query(
         10,
@@ -59,15 +152,25 @@ def list_books(
         le=100,
         description="Maximum number of records to return.",
     ),
-    db: Session = Depends(database.get_db),
-) -> List[schemas.BookRead]:
-    """Get all books with simple pagination (GET /books/)."""
-    return (
-        db.query(models.Book)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    db: AsyncSession = Depends(database.get_db),
+) -> Response:
+    """Get all books with keyset pagination (GET /books/).
+
+    Pass the returned `next_cursor` as `after_id` to fetch the next page.
+    """
+    query = select(models.Book).order_by(models.Book.id)
+    if after_id is not None:
+        query = query.where(models.Book.id > after_id)
+
+    books = (await db.scalars(query.offset(skip).limit(limit))).all()
+    next_cursor = books[-1].id if len(books) == limit else None
+    # Returning a response directly skips FastAPI's response_model pass;
+    # response_model is kept for the OpenAPI schema.
+    page = schemas.BookPage.model_validate(
+        {"items": books, "next_cursor": next_cursor},
+        from_attributes=True,
     )
+    return _json_response(page.model_dump_json().encode())
 
 
 @app.delete(
@@ -75,24 +178,20 @@ def list_books(
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["books"],
 )
-def delete_book(
+async def delete_book(
     book_id: int,
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_db),
 ) -> None:
     """Delete a book by ID (DELETE /books/{book_id})."""
-    db_book = (
-        db.query(models.Book)
-        .filter(models.Book.id == book_id)
-        .first()
-    )
+    db_book = await db.get(models.Book, book_id)
     if db_book is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Book with id {book_id} not found.",
         )
 
-    db.delete(db_book)
-    db.commit()
+    await db.delete(db_book)
+    await db.commit()
 
 
 @app.put(
@@ -100,29 +199,31 @@ def delete_book(
     response_model=schemas.BookRead,
     tags=["books"],
 )
-def update_book(
+async def update_book(
     book_id: int,
     book_update: schemas.BookUpdate,
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_db),
 ) -> schemas.BookRead:
     """Update book details (PUT /books/{book_id})."""
-    db_book = (
-        db.query(models.Book)
-        .filter(models.Book.id == book_id)
-        .first()
-    )
+    update_data = book_update.model_dump(exclude_unset=True)
+    if update_data:
+        stmt = (
+            update(models.Book)
+            .where(models.Book.id == book_id)
+            .values(**update_data)
+            .returning(models.Book)
+        )
+        db_book = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        db_book = await db.get(models.Book, book_id)
+
     if db_book is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Book with id {book_id} not found.",
         )
 
-    update_data = book_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_book, field, value)
-
-    db.commit()
-    db.refresh(db_book)
+    await db.commit()
     return db_book
 
 
@@ -131,7 +232,7 @@ def update_book(
     response_model=List[schemas.BookRead],
     tags=["books"],
 )
-def search_books(
+async def search_books(
     title: Optional[str] = Query(
         None,
         description="Search by title (substring, case-insensitive).",
@@ -155,16 +256,24 @@ def search_books(
         le=100,
         description="Maximum number of records to return.",
     ),
-    db: Session = Depends(database.get_db),
-) -> List[schemas.BookRead]:
-    """Search books by title, author, or year with pagination."""
-    query = db.query(models.Book)
+    db: AsyncSession = Depends(database.get_db),
+) -> Response:
+    """Search books by title, author, or year with pagination.
+
+    `%` and `_` in the search text are matched literally, not as wildcards.
+    """
+    query = select(models.Book)
 
     if title is not None:
-        query = query.filter(models.Book.title.ilike(f"%{title}%"))
+        query = query.where(
+            models.Book.title.icontains(title, autoescape=True)
+        )
     if author is not None:
-        query = query.filter(models.Book.author.ilike(f"%{author}%"))
+        query = query.where(
+            models.Book.author.icontains(author, autoescape=True)
+        )
     if year is not None:
-        query = query.filter(models.Book.year == year)
+        query = query.where(models.Book.year == year)
 
-    return query.offset(skip).limit(limit).all()
+    books = (await db.scalars(query.offset(skip).limit(limit))).all()
+    return _json_response(_dump_books(books))
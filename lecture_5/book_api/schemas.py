@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class BookBase(BaseModel):
@@ -33,3 +33,14 @@ class BookRead(BookBase):
     id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class BookPage(BaseModel):
+    """A page of books with the cursor for fetching the next page."""
+
+    items: List[BookRead]
+    next_cursor: Optional[int] = None
+
+
+# Built once at import so list endpoints do not rebuild a validator per call.
+BookListAdapter: TypeAdapter[List[BookRead]] = TypeAdapter(List[BookRead])
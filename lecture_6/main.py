@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 # Create FastAPI application
 app = FastAPI()
 
+# Pre-encoded healthcheck response, reused for every probe
+_HEALTHCHECK_OK = Response(
+    content=b'{"status":"ok"}',
+    media_type="application/json",
+    headers={"Cache-Control": "no-store"},
+)
 
-@app.get("/healthcheck")
-async def healthcheck() -> dict[str, str]:
+
+@app.api_route("/healthcheck", methods=["GET", "HEAD"])
+async def healthcheck() -> Response:
     """Return simple status"""
-    return {"status": "ok"}
\ No newline at end of file
+    return _HEALTHCHECK_OK